@@ -11,11 +11,17 @@ Based on base58 encoding characteristics of DID keys.
 """
 
 import math
-from typing import Any, Dict
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Tuple
 
 from ..domain import FuzzyMode, MatchMode, Pattern
 
 
+def _fixed_string_odds(alphabet_size: int, max_length: int) -> Tuple[float, ...]:
+    """Probability of one fixed string of each length: 1 / alphabet_size^length."""
+    return tuple(1.0 / (alphabet_size**length) for length in range(max_length))
+
+
 class ProbabilityCalculator:
     """
     Calculate probability and cost for vanity key patterns.
@@ -53,6 +59,9 @@ class ProbabilityCalculator:
     BASE58_CHARS = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
     BASE58_SIZE = len(BASE58_CHARS)  # 58
 
+    # 1 / 58^length for every practical substring length, indexed by length
+    _BASE58_ODDS = _fixed_string_odds(BASE58_SIZE, 64)
+
     # Fuzzy matching multipliers (how many valid chars per position)
     FUZZY_EQUIVALENTS = {
         "0": 2,  # 0 or O
@@ -75,9 +84,23 @@ class ProbabilityCalculator:
     BASE_COST = 50  # Base cost for easiest patterns
     COST_PER_ORDER = 10  # Additional cost per 10x difficulty
 
+    # Odds display scales: lower bound of each bucket, then (divisor, suffix)
+    _ODDS_THRESHOLDS = (1_000, 1_000_000, 1_000_000_000, 1_000_000_000_000)
+    _ODDS_SCALES = (
+        (1, ""),
+        (1_000, "K"),
+        (1_000_000, "M"),
+        (1_000_000_000, "B"),
+        (1_000_000_000_000, "T"),
+    )
+
+    # Maximum number of pattern results remembered per calculator
+    CACHE_SIZE = 256
+
     def __init__(self):
         """Initialize calculator."""
-        pass
+        # Results keyed on the pattern fields that affect the calculation
+        self._cache: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
 
     def calculate(self, pattern: Pattern) -> Dict[str, Any]:
         """
@@ -95,6 +118,35 @@ class ProbabilityCalculator:
                 - cost_tokens: VaniTokens cost for gacha pull
                 - cost_guaranteed_usd: USD cost for guaranteed mode
         """
+        key = (pattern.mode, pattern.fuzzy, tuple(pattern.substrings))
+        result = self._cache.get(key)
+        if result is None:
+            result = self._calculate_uncached(pattern)
+            if len(self._cache) >= self.CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = result
+
+        # Callers may modify the returned dict, so never hand out the cached one
+        return dict(result)
+
+    def calculate_many(self, patterns: Iterable[Pattern]) -> List[Dict[str, Any]]:
+        """
+        Calculate probability and cost for several patterns.
+
+        Equivalent to calling :meth:`calculate` on each pattern in turn;
+        repeated patterns in the batch are only computed once.
+
+        Args:
+            patterns: Patterns to analyze
+
+        Returns:
+            One result dictionary per pattern, in input order
+        """
+        calculate = self.calculate
+        return [calculate(pattern) for pattern in patterns]
+
+    def _calculate_uncached(self, pattern: Pattern) -> Dict[str, Any]:
+        """Compute the :meth:`calculate` result for a pattern from scratch."""
         # Calculate based on match mode
         if pattern.mode == MatchMode.PREFIX:
             prob = self._calculate_prefix(pattern)
@@ -112,7 +164,7 @@ class ProbabilityCalculator:
 
         # Calculate derived metrics
         expected_attempts = 1.0 / prob if prob > 0 else float("inf")
-        difficulty_score = math.log10(expected_attempts) if expected_attempts > 1 else 0
+        difficulty_score = self._difficulty_score(expected_attempts)
         odds_display = self._format_odds(expected_attempts)
         cost_tokens = self._calculate_token_cost(difficulty_score)
         cost_guaranteed_usd = self._calculate_guaranteed_cost(expected_attempts)
@@ -126,14 +178,51 @@ class ProbabilityCalculator:
             "cost_guaranteed_usd": cost_guaranteed_usd,
         }
 
+    def meets_difficulty(self, pattern: Pattern, threshold: float) -> bool:
+        """
+        Check whether a pattern's difficulty score reaches a threshold.
+
+        Gives the same answer as ``calculate(pattern)["difficulty_score"] >=
+        threshold``. Multi-substring patterns stop as soon as the substrings
+        seen so far are already hard enough, since each further substring
+        can only make the pattern harder.
+
+        Args:
+            pattern: The pattern to analyze
+            threshold: Minimum difficulty score (log10 of expected attempts)
+
+        Returns:
+            True if the pattern is at least that difficult
+        """
+        if pattern.mode != MatchMode.MULTI_SUBSTRING:
+            return self.calculate(pattern)["difficulty_score"] >= threshold
+
+        # Same running product as _calculate_multi_substring
+        total_prob = 1.0
+        for substring in pattern.substrings:
+            total_prob *= self._contains_probability(substring.upper(), pattern.fuzzy)
+            expected_attempts = 1.0 / total_prob if total_prob > 0 else float("inf")
+            if self._difficulty_score(expected_attempts) >= threshold:
+                return True
+
+        return False
+
+    @staticmethod
+    def _difficulty_score(expected_attempts: float) -> float:
+        """Log10 of expected attempts (0 for patterns that always match)."""
+        return math.log10(expected_attempts) if expected_attempts > 1 else 0
+
     def _calculate_prefix(self, pattern: Pattern) -> float:
         """Calculate probability for prefix match."""
-        substring = pattern.substrings[0]
+        return self._prefix_probability(pattern.substrings[0], pattern.fuzzy)
+
+    def _prefix_probability(self, substring: str, fuzzy: FuzzyMode) -> float:
+        """Probability of a substring appearing at one fixed position."""
         length = len(substring)
 
         # Base probability: 1 / (58^length)
-        if pattern.fuzzy == FuzzyMode.NONE:
-            return 1.0 / (self.BASE58_SIZE ** length)
+        if fuzzy == FuzzyMode.NONE:
+            return self._base58_odds(length)
 
         # Fuzzy matching: some positions have more valid chars
         denominator = 1.0
@@ -164,11 +253,14 @@ class ProbabilityCalculator:
 
         The key might have multiple positions where the pattern could appear.
         """
-        substring = pattern.substrings[0]
+        return self._contains_probability(pattern.substrings[0], pattern.fuzzy)
+
+    def _contains_probability(self, substring: str, fuzzy: FuzzyMode) -> float:
+        """Probability of a substring appearing anywhere in a key."""
         length = len(substring)
 
         # Base probability for prefix
-        base_prob = self._calculate_prefix(pattern)
+        base_prob = self._prefix_probability(substring, fuzzy)
 
         # DID keys are ~44 chars after "did:key:z6Mk"
         # So roughly 44 positions where pattern could start
@@ -196,14 +288,8 @@ class ProbabilityCalculator:
         total_prob = 1.0
 
         for substring in pattern.substrings:
-            # Create temporary pattern for this substring
-            temp_pattern = Pattern(
-                substrings=[substring],
-                mode=MatchMode.CONTAINS,
-                fuzzy=pattern.fuzzy,
-            )
-            sub_prob = self._calculate_contains(temp_pattern)
-            total_prob *= sub_prob
+            # Uppercase as a case-insensitive single-substring pattern would
+            total_prob *= self._contains_probability(substring.upper(), pattern.fuzzy)
 
         return total_prob
 
@@ -218,7 +304,14 @@ class ProbabilityCalculator:
         pattern_str = pattern.pattern_string
         # Rough estimate: treat like "contains" with length
         length = len(pattern_str.replace(".*", "").replace("\\", ""))
-        return 1.0 / (self.BASE58_SIZE ** max(1, length))
+        return self._base58_odds(max(1, length))
+
+    def _base58_odds(self, length: int) -> float:
+        """Probability of a fixed base58 string of the given length: 1 / 58^length."""
+        odds = self._BASE58_ODDS
+        if length < len(odds):
+            return odds[length]
+        return 1.0 / (self.BASE58_SIZE ** length)
 
     def _format_odds(self, expected_attempts: float) -> str:
         """
@@ -236,19 +329,10 @@ class ProbabilityCalculator:
         if expected_attempts < 1:
             return "~100% chance"
 
-        if expected_attempts < 1000:
-            return f"1 in {expected_attempts:.1f}"
-
-        if expected_attempts < 1_000_000:
-            return f"1 in {expected_attempts / 1000:.1f}K"
-
-        if expected_attempts < 1_000_000_000:
-            return f"1 in {expected_attempts / 1_000_000:.1f}M"
-
-        if expected_attempts < 1_000_000_000_000:
-            return f"1 in {expected_attempts / 1_000_000_000:.1f}B"
-
-        return f"1 in {expected_attempts / 1_000_000_000_000:.1f}T"
+        scale, suffix = self._ODDS_SCALES[
+            bisect_right(self._ODDS_THRESHOLDS, expected_attempts)
+        ]
+        return f"1 in {expected_attempts / scale:.1f}{suffix}"
 
     def _calculate_token_cost(self, difficulty_score: float) -> int:
         """
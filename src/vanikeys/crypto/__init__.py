@@ -18,6 +18,7 @@ from .derivation import (
     seed_to_root_keypair,
     derive_child_seed,
     derive_child_keypair,
+    derive_children_keypair,
     public_key_to_bytes,
     private_key_to_bytes,
 )
@@ -26,7 +27,9 @@ from .fingerprint import (
     ssh_public_key_to_bytes,
     ssh_public_key_to_authorized_keys_format,
     compute_ssh_fingerprint,
+    compute_ssh_fingerprint_batch,
     compute_ssh_fingerprint_md5,
+    compute_ssh_fingerprint_md5_batch,
     extract_fingerprint_searchable,
 )
 
@@ -38,6 +41,7 @@ from .matching import (
 from .proofs import (
     generate_derivation_proof,
     verify_derivation_proof,
+    verify_derivation_proofs_batch,
 )
 
 __all__ = [
@@ -46,13 +50,16 @@ __all__ = [
     "seed_to_root_keypair",
     "derive_child_seed",
     "derive_child_keypair",
+    "derive_children_keypair",
     "public_key_to_bytes",
     "private_key_to_bytes",
     # Fingerprint
     "ssh_public_key_to_bytes",
     "ssh_public_key_to_authorized_keys_format",
     "compute_ssh_fingerprint",
+    "compute_ssh_fingerprint_batch",
     "compute_ssh_fingerprint_md5",
+    "compute_ssh_fingerprint_md5_batch",
     "extract_fingerprint_searchable",
     # Matching
     "create_pattern_matcher",
@@ -60,4 +67,5 @@ __all__ = [
     # Proofs
     "generate_derivation_proof",
     "verify_derivation_proof",
+    "verify_derivation_proofs_batch",
 ]
@@ -17,19 +17,17 @@ See: docs/HD_DERIVATION_IMPLEMENTATION.md for implementation details
 import secrets
 import hashlib
 import struct
-from typing import Tuple
+from typing import Iterable, List, Tuple
 
 from cryptography.hazmat.primitives.asymmetric import ed25519
-from cryptography.hazmat.primitives.serialization import (
-    Encoding,
-    PublicFormat,
-    PrivateFormat,
-    NoEncryption,
-)
 
 # Protocol version identifier (prevents cross-protocol attacks)
 DERIVATION_CONTEXT = b"vanikeys-ssh-v1"
 
+# Path index encoder (4-byte big-endian), precompiled once instead of
+# re-parsing the format string on every struct.pack() call
+_pack_path_index = struct.Struct(">I").pack
+
 
 def generate_master_seed() -> bytes:
     """
@@ -115,7 +113,7 @@ def derive_child_seed(parent_seed: bytes, path_index: int) -> bytes:
     assert 0 <= path_index < 2**32, "Path index must be in range [0, 2^32)"
 
     # Encode path index as 4-byte big-endian
-    index_bytes = struct.pack(">I", path_index)
+    index_bytes = _pack_path_index(path_index)
 
     # Hash: parent_seed || context || index
     h = hashlib.sha512()
@@ -152,14 +150,59 @@ def derive_child_keypair(
         >>> priv, pub = derive_child_keypair(seed, 42)
         >>> isinstance(priv, ed25519.Ed25519PrivateKey)
         True
-        >>> priv.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw) == \\
-        ...     pub.public_bytes(Encoding.Raw, PublicFormat.Raw)
+        >>> public_key_to_bytes(priv.public_key()) == public_key_to_bytes(pub)
         True
     """
     child_seed = derive_child_seed(parent_seed, path_index)
     return seed_to_root_keypair(child_seed)
 
 
+def derive_children_keypair(
+    parent_seed: bytes, path_indices: Iterable[int]
+) -> List[Tuple[ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey]]:
+    """
+    Derive child key pairs for many path indices of the same parent.
+
+    Produces the same keys as calling derive_child_keypair() per index,
+    but hashes parent_seed || context once and copies that SHA-512 state
+    for each index, so only the 4-byte index is hashed per child.
+
+    Args:
+        parent_seed: 32-byte parent seed
+        path_indices: Integer path indices (0 to 2^32-1)
+
+    Returns:
+        List of (child_private_key, child_public_key) tuples, in input order
+
+    Raises:
+        AssertionError: If parent_seed is not 32 bytes or an index is out of range
+
+    Example:
+        >>> seed = generate_master_seed()
+        >>> pairs = derive_children_keypair(seed, range(4))
+        >>> len(pairs)
+        4
+    """
+    assert len(parent_seed) == 32, "Parent seed must be 32 bytes"
+
+    base = hashlib.sha512()
+    base.update(parent_seed)
+    base.update(DERIVATION_CONTEXT)
+
+    from_private_bytes = ed25519.Ed25519PrivateKey.from_private_bytes
+    pack = _pack_path_index
+
+    keypairs = []
+    for path_index in path_indices:
+        assert 0 <= path_index < 2**32, "Path index must be in range [0, 2^32)"
+        h = base.copy()
+        h.update(pack(path_index))
+        private_key = from_private_bytes(h.digest()[:32])
+        keypairs.append((private_key, private_key.public_key()))
+
+    return keypairs
+
+
 def public_key_to_bytes(public_key: ed25519.Ed25519PublicKey) -> bytes:
     """
     Convert Ed25519 public key to raw 32-byte representation.
@@ -182,7 +225,9 @@ def public_key_to_bytes(public_key: ed25519.Ed25519PublicKey) -> bytes:
         >>> len(pub_bytes)
         32
     """
-    return public_key.public_bytes(encoding=Encoding.Raw, format=PublicFormat.Raw)
+    # Equivalent to public_bytes(Encoding.Raw, PublicFormat.Raw), without
+    # building the enum/format arguments on every call
+    return public_key.public_bytes_raw()
 
 
 def private_key_to_bytes(private_key: ed25519.Ed25519PrivateKey) -> bytes:
@@ -209,11 +254,8 @@ def private_key_to_bytes(private_key: ed25519.Ed25519PrivateKey) -> bytes:
         >>> priv_bytes == seed
         True
     """
-    return private_key.private_bytes(
-        encoding=Encoding.Raw,
-        format=PrivateFormat.Raw,
-        encryption_algorithm=NoEncryption(),
-    )
+    # Equivalent to private_bytes(Raw, Raw, NoEncryption())
+    return private_key.private_bytes_raw()
 
 
 # Server-side function (for testing - server never has seed in production)
@@ -252,9 +294,13 @@ def search_vanity_path_simple(
 
     matcher = create_pattern_matcher(pattern, case_sensitive)
 
+    # Bind hot-loop callables locally (avoids global lookups per attempt)
+    derive = derive_child_keypair
+    fingerprint_of = compute_ssh_fingerprint
+
     for path_index in range(max_attempts):
-        _, child_public = derive_child_keypair(root_seed, path_index)
-        fingerprint = compute_ssh_fingerprint(child_public)
+        _, child_public = derive(root_seed, path_index)
+        fingerprint = fingerprint_of(child_public)
 
         if matcher(fingerprint):
             return {
@@ -13,13 +13,18 @@ See: RFC 4253 (SSH Protocol) for key format specifications
 """
 
 import hashlib
-import struct
 import base64
+import binascii
+from typing import Iterable, List
 from cryptography.hazmat.primitives.asymmetric import ed25519
-from cryptography.hazmat.primitives.serialization import (
-    Encoding,
-    PublicFormat,
-)
+
+# Constant SSH wire-format header for Ed25519 keys:
+# string "ssh-ed25519" followed by the 4-byte length of the 32-byte key
+_SSH_ED25519_PREFIX = b"\x00\x00\x00\x0bssh-ed25519\x00\x00\x00\x20"
+
+# SHA256 state already fed the header. Copying it and hashing only the
+# 32 raw key bytes avoids rebuilding the wire format per fingerprint.
+_SSH_ED25519_HEADER_SHA256 = hashlib.sha256(_SSH_ED25519_PREFIX)
 
 
 def ssh_public_key_to_bytes(public_key: ed25519.Ed25519PublicKey) -> bytes:
@@ -46,15 +51,10 @@ def ssh_public_key_to_bytes(public_key: ed25519.Ed25519PublicKey) -> bytes:
         >>> len(wire_bytes) > 32  # Wire format is larger than raw key
         True
     """
-    key_type = b"ssh-ed25519"
-    key_data = public_key.public_bytes(encoding=Encoding.Raw, format=PublicFormat.Raw)
+    key_data = public_key.public_bytes_raw()
 
-    # SSH string encoding: 4-byte length (big-endian) + data
-    def ssh_string(data: bytes) -> bytes:
-        return struct.pack(">I", len(data)) + data
-
-    wire_format = ssh_string(key_type) + ssh_string(key_data)
-    return wire_format
+    # Type string and key length are constant for Ed25519
+    return _SSH_ED25519_PREFIX + key_data
 
 
 def ssh_public_key_to_authorized_keys_format(
@@ -123,17 +123,59 @@ def compute_ssh_fingerprint(public_key: ed25519.Ed25519PublicKey) -> str:
         >>> len(fp)
         50  # "SHA256:" (7 chars) + 43 chars base64
     """
-    wire_bytes = ssh_public_key_to_bytes(public_key)
+    # SHA256 hash of wire format (header pre-hashed, append raw key)
+    h = _SSH_ED25519_HEADER_SHA256.copy()
+    h.update(public_key.public_bytes_raw())
+    digest = h.digest()
 
-    # SHA256 hash of wire format
-    digest = hashlib.sha256(wire_bytes).digest()
-
-    # Base64 encode without padding
-    b64 = base64.b64encode(digest).decode("ascii").rstrip("=")
+    # Base64 encode without padding (binascii directly; base64.b64encode
+    # is a thin wrapper around it). A 32-byte digest always encodes to 43
+    # characters plus a single "=", so slice instead of scanning for it.
+    b64 = binascii.b2a_base64(digest, newline=False)[:43].decode("ascii")
 
     return f"SHA256:{b64}"
 
 
+def compute_ssh_fingerprint_batch(
+    public_keys: Iterable[ed25519.Ed25519PublicKey],
+) -> List[str]:
+    """
+    Compute SHA256 SSH fingerprints for many public keys.
+
+    Produces the same output as calling compute_ssh_fingerprint() on each
+    key, but resolves the hashing/encoding functions once for the whole
+    batch. Use this in vanity search loops that fingerprint candidate
+    keys in bulk.
+
+    Args:
+        public_keys: Ed25519 public keys
+
+    Returns:
+        List of SSH fingerprint strings, in input order
+
+    Example:
+        >>> from vanikeys.crypto import generate_master_seed, derive_child_keypair
+        >>> seed = generate_master_seed()
+        >>> pubs = [derive_child_keypair(seed, i)[1] for i in range(8)]
+        >>> fps = compute_ssh_fingerprint_batch(pubs)
+        >>> fps[3] == compute_ssh_fingerprint(pubs[3])
+        True
+    """
+    header_copy = _SSH_ED25519_HEADER_SHA256.copy
+    b2a_base64 = binascii.b2a_base64
+
+    fingerprints = []
+    append = fingerprints.append
+    for public_key in public_keys:
+        # Same pre-hashed header state as compute_ssh_fingerprint()
+        h = header_copy()
+        h.update(public_key.public_bytes_raw())
+        b64 = b2a_base64(h.digest(), newline=False)[:43].decode("ascii")
+        append("SHA256:" + b64)
+
+    return fingerprints
+
+
 def compute_ssh_fingerprint_md5(public_key: ed25519.Ed25519PublicKey) -> str:
     """
     Compute SSH fingerprint (MD5, legacy format).
@@ -161,14 +203,34 @@ def compute_ssh_fingerprint_md5(public_key: ed25519.Ed25519PublicKey) -> str:
         >>> len(fp_md5.split(":"))
         16  # 16 hex pairs
     """
-    wire_bytes = ssh_public_key_to_bytes(public_key)
-
     # MD5 hash of wire format
-    digest = hashlib.md5(wire_bytes).digest()
+    digest = hashlib.md5(_SSH_ED25519_PREFIX + public_key.public_bytes_raw()).digest()
 
     # Format as colon-separated hex pairs
-    hex_pairs = [f"{b:02x}" for b in digest]
-    return ":".join(hex_pairs)
+    return digest.hex(":")
+
+
+def compute_ssh_fingerprint_md5_batch(
+    public_keys: Iterable[ed25519.Ed25519PublicKey],
+) -> List[str]:
+    """
+    Compute MD5 SSH fingerprints for many public keys.
+
+    Batch counterpart of compute_ssh_fingerprint_md5(), see
+    compute_ssh_fingerprint_batch().
+
+    Args:
+        public_keys: Ed25519 public keys
+
+    Returns:
+        List of MD5 fingerprint strings, in input order
+    """
+    md5 = hashlib.md5
+    prefix = _SSH_ED25519_PREFIX
+    return [
+        md5(prefix + public_key.public_bytes_raw()).digest().hex(":")
+        for public_key in public_keys
+    ]
 
 
 def extract_fingerprint_searchable(fingerprint: str) -> str:
@@ -194,7 +256,8 @@ def extract_fingerprint_searchable(fingerprint: str) -> str:
         >>> extract_fingerprint_searchable("16:27:ac")
         '16:27:ac'
     """
-    if fingerprint.startswith("SHA256:"):
+    # Slice comparison avoids the startswith() method lookup/call
+    if fingerprint[:7] == "SHA256:":
         return fingerprint[7:]  # Remove "SHA256:" prefix
     return fingerprint
 
@@ -281,6 +344,10 @@ def compare_fingerprints(fp1: str, fp2: str) -> bool:
         >>> compare_fingerprints(fp1, fp2)
         True
     """
+    # Common case: identical strings, no normalization needed
+    if fp1 == fp2:
+        return True
+
     # Normalize: remove spaces, lowercase
     norm1 = fp1.replace(" ", "").lower()
     norm2 = fp2.replace(" ", "").lower()
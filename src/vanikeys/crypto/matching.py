@@ -49,35 +49,43 @@ def create_pattern_matcher(
         >>> regex_matcher("SHA256:labABCxxxxxxxxx")
         False
     """
-    if not case_sensitive:
-        pattern = pattern.lower()
-
     # Detect if regex (contains special characters)
     is_regex = any(c in pattern for c in r"[](){}^$.*+?|\\")
 
     if is_regex:
-        # Compile regex
-        compiled_regex = re.compile(
+        # Compile regex once; IGNORECASE handles case folding, so neither
+        # the pattern nor each candidate needs lowercasing (lowercasing the
+        # pattern would also turn escapes like \D into \d)
+        search = re.compile(
             pattern, flags=0 if case_sensitive else re.IGNORECASE
-        )
+        ).search
 
         def regex_matcher(fingerprint: str) -> bool:
-            searchable = extract_fingerprint_searchable(fingerprint)
-            if not case_sensitive:
-                searchable = searchable.lower()
-            return compiled_regex.search(searchable) is not None
+            return search(extract_fingerprint_searchable(fingerprint)) is not None
 
         return regex_matcher
-    else:
-        # Simple substring search (faster)
+
+    # Simple substring search (faster). One closure per case mode keeps
+    # the per-candidate path branch-free; the "SHA256:" prefix is skipped
+    # inline rather than via extract_fingerprint_searchable().
+    if case_sensitive:
+
         def substring_matcher(fingerprint: str) -> bool:
-            searchable = extract_fingerprint_searchable(fingerprint)
-            if not case_sensitive:
-                searchable = searchable.lower()
-            return pattern in searchable
+            if fingerprint[:7] == "SHA256:":
+                fingerprint = fingerprint[7:]
+            return pattern in fingerprint
 
         return substring_matcher
 
+    pattern = pattern.lower()
+
+    def substring_matcher_nocase(fingerprint: str) -> bool:
+        if fingerprint[:7] == "SHA256:":
+            fingerprint = fingerprint[7:]
+        return pattern in fingerprint.lower()
+
+    return substring_matcher_nocase
+
 
 def matches_pattern(
     pattern: str, fingerprint: str, case_sensitive: bool = False
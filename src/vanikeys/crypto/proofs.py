@@ -12,15 +12,16 @@ Customers verify proofs BEFORE deriving their private keys.
 """
 
 import hashlib
-import struct
 import base64
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional
 from cryptography.hazmat.primitives.asymmetric import ed25519
 
 from .derivation import (
     derive_child_keypair,
     public_key_to_bytes,
+    seed_to_root_keypair,
     DERIVATION_CONTEXT,
+    _pack_path_index,
 )
 from .fingerprint import compute_ssh_fingerprint
 
@@ -76,7 +77,7 @@ def generate_derivation_proof(
     # Hash(root_public || path_index || context)
     h = hashlib.sha256()
     h.update(root_public_bytes)
-    h.update(struct.pack(">I", path_index))
+    h.update(_pack_path_index(path_index))
     h.update(DERIVATION_CONTEXT)
     derivation_hash = h.digest()
 
@@ -131,6 +132,68 @@ def verify_derivation_proof(proof: Dict[str, Any], master_seed: bytes) -> bool:
         >>> verify_derivation_proof(bad_proof, seed)
         False
     """
+    return _verified_child_public(proof, master_seed) is not None
+
+
+def verify_derivation_proofs_batch(
+    proofs: Iterable[Dict[str, Any]], master_seed: bytes
+) -> List[bool]:
+    """
+    Verify many derivation proofs against the same master seed.
+
+    Equivalent to calling verify_derivation_proof() on each proof, but the
+    root keypair is derived once and its public key is hashed once; each
+    proof only hashes its own path index and context on top of that.
+
+    Args:
+        proofs: Proof dicts from generate_derivation_proof()
+        master_seed: Customer's 32-byte master seed
+
+    Returns:
+        List of verification results, in input order
+
+    Example:
+        >>> from vanikeys.crypto import generate_master_seed, seed_to_root_keypair
+        >>> from vanikeys.crypto import derive_child_keypair, public_key_to_bytes
+        >>> seed = generate_master_seed()
+        >>> root_bytes = public_key_to_bytes(seed_to_root_keypair(seed)[1])
+        >>> proofs = []
+        >>> for i in range(4):
+        ...     _, child_pub = derive_child_keypair(seed, i)
+        ...     proofs.append(generate_derivation_proof(root_bytes, i, child_pub))
+        >>> verify_derivation_proofs_batch(proofs, seed)
+        [True, True, True, True]
+    """
+    root_hash = _root_derivation_hash(master_seed)
+    return [
+        _verified_child_public(proof, master_seed, root_hash) is not None
+        for proof in proofs
+    ]
+
+
+def _root_derivation_hash(master_seed: bytes) -> Any:
+    """SHA256 state over the root public key (common prefix of derivation hashes)."""
+    _, root_public = seed_to_root_keypair(master_seed)
+    return hashlib.sha256(public_key_to_bytes(root_public))
+
+
+def _verified_child_public(
+    proof: Dict[str, Any],
+    master_seed: bytes,
+    root_hash: Any = None,
+) -> Optional[ed25519.Ed25519PublicKey]:
+    """
+    Check a derivation proof, returning the derived child public key.
+
+    Args:
+        proof: Proof dict from generate_derivation_proof()
+        master_seed: Customer's 32-byte master seed
+        root_hash: Optional state from _root_derivation_hash(); computed
+            on demand if omitted
+
+    Returns:
+        Child public key if the proof is valid, else None
+    """
     try:
         # 1. Decode proof fields
         path_index = proof["path_index"]
@@ -143,29 +206,26 @@ def verify_derivation_proof(proof: Dict[str, Any], master_seed: bytes) -> bool:
 
         # 3. Verify child public key matches claimed
         if actual_child_bytes != claimed_child_public:
-            return False
+            return None
 
         # 4. Verify derivation hash
-        from .derivation import seed_to_root_keypair
-
-        _, root_public = seed_to_root_keypair(master_seed)
-        root_public_bytes = public_key_to_bytes(root_public)
+        if root_hash is None:
+            root_hash = _root_derivation_hash(master_seed)
 
-        h = hashlib.sha256()
-        h.update(root_public_bytes)
-        h.update(struct.pack(">I", path_index))
+        h = root_hash.copy()
+        h.update(_pack_path_index(path_index))
         h.update(DERIVATION_CONTEXT)
         expected_derivation_hash = h.digest()
 
         if expected_derivation_hash != claimed_derivation_hash:
-            return False
+            return None
 
         # All checks passed
-        return True
+        return actual_child_public
 
     except (KeyError, ValueError, TypeError):
         # Proof format invalid
-        return False
+        return None
 
 
 def generate_order_proof(
@@ -270,10 +330,48 @@ def verify_order_proof(
         >>> result['derivation_valid']
         True
     """
+    return _verify_order_proof(proof, master_seed, expected_pattern)
+
+
+def verify_order_proofs_batch(
+    proofs: Iterable[Dict[str, Any]], master_seed: bytes, expected_pattern: str
+) -> List[Dict[str, Any]]:
+    """
+    Verify many order proofs for the same seed and ordered pattern.
+
+    Equivalent to calling verify_order_proof() on each proof, but the root
+    keypair is derived (and its public key hashed) once for the whole batch.
+
+    Args:
+        proofs: Order proofs from generate_order_proof()
+        master_seed: Customer's master seed
+        expected_pattern: Pattern customer ordered
+
+    Returns:
+        List of verification result dicts (see verify_order_proof()),
+        in input order
+    """
+    root_hash = _root_derivation_hash(master_seed)
+    return [
+        _verify_order_proof(proof, master_seed, expected_pattern, root_hash)
+        for proof in proofs
+    ]
+
+
+def _verify_order_proof(
+    proof: Dict[str, Any],
+    master_seed: bytes,
+    expected_pattern: str,
+    root_hash: Any = None,
+) -> Dict[str, Any]:
+    """Shared implementation of verify_order_proof() and its batch variant."""
     errors = []
 
-    # Verify derivation proof
-    derivation_valid = verify_derivation_proof(proof["derivation"], master_seed)
+    # Verify derivation proof (keeps the derived child key on success)
+    derived_public = _verified_child_public(
+        proof["derivation"], master_seed, root_hash
+    )
+    derivation_valid = derived_public is not None
     if not derivation_valid:
         errors.append("Derivation proof invalid")
 
@@ -282,9 +380,11 @@ def verify_order_proof(
     fingerprint = pattern_proof["fingerprint"]
     pattern = pattern_proof["pattern"]
 
-    # Re-compute fingerprint from derived key
-    path_index = proof["derivation"]["path_index"]
-    _, derived_public = derive_child_keypair(master_seed, path_index)
+    # Re-compute fingerprint from derived key (derive only if the
+    # derivation check failed before producing one)
+    if derived_public is None:
+        path_index = proof["derivation"]["path_index"]
+        _, derived_public = derive_child_keypair(master_seed, path_index)
     computed_fingerprint = compute_ssh_fingerprint(derived_public)
 
     if computed_fingerprint != fingerprint:
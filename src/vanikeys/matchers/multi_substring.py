@@ -15,7 +15,7 @@ Examples:
     matcher.match("did:key:z6MkBOOMxxx")  # True (fuzzy: 0→O)
 """
 
-from typing import List, Tuple, Optional
+from typing import Callable, Iterable, List, Tuple, Optional
 import re
 
 
@@ -52,6 +52,17 @@ class FuzzyRules:
         "B": ["B", "8"],
     }
 
+    # Regex character class for each fuzzy character (all equivalents, both cases)
+    _CHAR_CLASSES = {
+        char: "[" + "".join(sorted({c for e in equivs for c in (e, e.lower())})) + "]"
+        for char, equivs in EQUIVALENTS.items()
+    }
+
+    # str.translate table mapping each character to its canonical form
+    _NORMALIZE_TABLE = str.maketrans(
+        "".join(EQUIVALENTS), "".join(equiv[0] for equiv in EQUIVALENTS.values())
+    )
+
     @classmethod
     def to_regex_pattern(cls, substring: str) -> str:
         """
@@ -67,24 +78,12 @@ class FuzzyRules:
         Returns:
             Regex pattern string with character classes for fuzzy matching
         """
-        pattern_parts = []
-        for char in substring.upper():
-            if char in cls.EQUIVALENTS:
-                # Create character class with all equivalents
-                equiv_chars = cls.EQUIVALENTS[char]
-                # Include both upper and lower case
-                char_class = []
-                for c in equiv_chars:
-                    char_class.append(c)
-                    char_class.append(c.lower())
-                # Remove duplicates and create character class
-                unique_chars = "".join(sorted(set(char_class)))
-                pattern_parts.append(f"[{unique_chars}]")
-            else:
-                # No fuzzy match, just case-insensitive
-                pattern_parts.append(f"[{char}{char.lower()}]")
-
-        return "".join(pattern_parts)
+        char_classes = cls._CHAR_CLASSES
+        return "".join(
+            # Fuzzy equivalents, otherwise just case-insensitive
+            char_classes.get(char) or f"[{char}{char.lower()}]"
+            for char in substring.upper()
+        )
 
     @classmethod
     def normalize(cls, text: str) -> str:
@@ -97,14 +96,7 @@ class FuzzyRules:
 
         This is useful for probability calculations.
         """
-        normalized = []
-        for char in text.upper():
-            if char in cls.EQUIVALENTS:
-                # Use the first (canonical) equivalent
-                normalized.append(cls.EQUIVALENTS[char][0])
-            else:
-                normalized.append(char)
-        return "".join(normalized)
+        return text.upper().translate(cls._NORMALIZE_TABLE)
 
 
 class MultiSubstringMatcher:
@@ -153,9 +145,56 @@ class MultiSubstringMatcher:
         self.fuzzy = fuzzy
         self.case_sensitive = case_sensitive
 
-        # Build regex pattern
+        # Build regex patterns, one per substring plus the combined pattern.
+        # Matching searches the substrings one after another rather than
+        # running the combined '.*?' pattern, which can backtrack heavily
+        self._sub_patterns = [self._substring_pattern(sub) for sub in substrings]
+        self._sub_regexes = [re.compile(pattern) for pattern in self._sub_patterns]
         self._pattern = self._build_pattern()
-        self._regex = re.compile(self._pattern)
+
+        # The combined pattern joins substrings with '.*?', and '.' does not
+        # match a newline, so unless a substring contains a newline itself
+        # every match lies within a single line of the text. Otherwise fall
+        # back to running the combined pattern
+        self._per_line = not any("\n" in sub for sub in substrings)
+        self._regex = None if self._per_line else re.compile(self._pattern)
+
+        # Exact case-sensitive patterns are plain literals: an ordered
+        # str.find cascade finds them without going through the regex VM
+        self._literal = not fuzzy and case_sensitive and self._per_line
+        self._subs_with_len = tuple((sub, len(sub)) for sub in substrings)
+
+        # Exact case-insensitive patterns reject most texts by looking for the
+        # lowercased first substring before running the regex. Only ASCII is
+        # safe here: some non-ASCII characters do not round-trip through lower()
+        first = substrings[0]
+        self._prefilter = None
+        if not fuzzy and not case_sensitive and first.isascii():
+            self._prefilter = first.lower()
+
+    def _substring_pattern(self, substring: str) -> str:
+        """
+        Build the regex pattern for a single substring.
+
+        Args:
+            substring: The substring to convert
+
+        Returns:
+            Regex pattern string
+        """
+        if self.fuzzy:
+            # Use fuzzy character classes
+            return FuzzyRules.to_regex_pattern(substring)
+
+        # Exact match (case-insensitive if needed)
+        if self.case_sensitive:
+            return re.escape(substring)
+
+        # Case-insensitive character classes
+        return "".join(
+            f"[{c.upper()}{c.lower()}]" if c.isalpha() else re.escape(c)
+            for c in substring
+        )
 
     def _build_pattern(self) -> str:
         """
@@ -164,28 +203,9 @@ class MultiSubstringMatcher:
         Returns:
             Regex pattern string
         """
-        pattern_parts = []
-
-        for substring in self.substrings:
-            if self.fuzzy:
-                # Use fuzzy character classes
-                sub_pattern = FuzzyRules.to_regex_pattern(substring)
-            else:
-                # Exact match (case-insensitive if needed)
-                if self.case_sensitive:
-                    sub_pattern = re.escape(substring)
-                else:
-                    # Case-insensitive character classes
-                    sub_pattern = "".join(
-                        f"[{c.upper()}{c.lower()}]" if c.isalpha() else re.escape(c)
-                        for c in substring
-                    )
-
-            pattern_parts.append(sub_pattern)
-
         # Join with .*? (non-greedy any characters)
         # This ensures substrings appear in order
-        return ".*?".join(pattern_parts)
+        return ".*?".join(self._sub_patterns)
 
     def match(self, text: str) -> bool:
         """
@@ -197,11 +217,145 @@ class MultiSubstringMatcher:
         Returns:
             True if pattern matches, False otherwise
         """
-        return self._regex.search(text) is not None
+        if self._prefilter is not None and self._prefilter not in text.lower():
+            return False
+        return self._find(text) is not None
 
-    def match_positions(self, text: str) -> Optional[List[Tuple[int, int]]]:
+    def match_many(self, texts: Iterable[str]) -> List[bool]:
         """
-        Find match positions for each substring.
+        Check many texts against the pattern.
+
+        Same results as calling :meth:`match` on each text, but texts missing
+        the first substring are rejected inline, without a method call. When
+        grinding keys, that is nearly every candidate.
+
+        Args:
+            texts: Texts to check (typically DID keys)
+
+        Returns:
+            One bool per text, in input order
+        """
+        match = self.match
+        if self._literal:
+            first = self._subs_with_len[0][0]
+            return [first in text and match(text) for text in texts]
+        if self._prefilter is not None:
+            first = self._prefilter
+            find = self._find
+            return [
+                first in text.lower() and find(text) is not None for text in texts
+            ]
+        return [match(text) for text in texts]
+
+    def _find(self, text: str) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find the leftmost match, as the combined regex pattern would.
+
+        Args:
+            text: Text to check
+
+        Returns:
+            List of (start, end) positions for each substring, or None if no match
+        """
+        if not self._per_line:
+            return self._combined_scan(text)
+
+        scan = self._scan if self._literal else self._regex_scan
+        if "\n" not in text:
+            # Single-line text (e.g. a DID key): one scan covers it
+            return scan(text, 0, len(text))
+        return self._find_by_line(text, scan)
+
+    def _find_by_line(
+        self,
+        text: str,
+        scan: Callable[[str, int, int], Optional[List[Tuple[int, int]]]],
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Run a substring scan over each line of text in turn.
+
+        Only valid when no substring contains a newline: the combined regex
+        cannot match across lines, so the leftmost match is the first match
+        found in any line.
+
+        Args:
+            text: Text to check
+            scan: Bound scan method taking (text, start, end)
+
+        Returns:
+            Positions of the leftmost match, or None if no line matches
+        """
+        start = 0
+        while True:
+            end = text.find("\n", start)
+            if end < 0:
+                return scan(text, start, len(text))
+            positions = scan(text, start, end)
+            if positions is not None:
+                return positions
+            start = end + 1
+
+    def _scan(
+        self, text: str, start: int, end: int
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find each substring in order within text[start:end] using ``str.find``.
+
+        Only valid for exact, case-sensitive patterns scanned one line at a
+        time. Within a line, taking the earliest occurrence of each substring
+        is enough to decide an ordered match, and gives the same positions as
+        the leftmost regex match.
+
+        Args:
+            text: Text to check
+            start: Index to start searching from
+            end: Index to stop searching at (exclusive)
+
+        Returns:
+            List of (start, end) positions for each substring, or None if no match
+        """
+        positions = []
+        for substring, length in self._subs_with_len:
+            index = text.find(substring, start, end)
+            if index < 0:
+                return None
+            start = index + length
+            positions.append((index, start))
+        return positions
+
+    def _regex_scan(
+        self, text: str, start: int, end: int
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find each substring's regex in order within text[start:end].
+
+        Only valid when scanning one line at a time. Every substring pattern
+        has a fixed width, so within a line the leftmost occurrence also ends
+        earliest and is always the best one to continue from. This runs in
+        linear passes, with no backtracking between substrings.
+
+        Args:
+            text: Text to check
+            start: Index to start searching from
+            end: Index to stop searching at (exclusive)
+
+        Returns:
+            List of (start, end) positions for each substring, or None if no match
+        """
+        positions = []
+        for sub_regex in self._sub_regexes:
+            found = sub_regex.search(text, start, end)
+            if found is None:
+                return None
+            start = found.end()
+            positions.append(found.span())
+        return positions
+
+    def _combined_scan(self, text: str) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find positions with the combined regex pattern.
+
+        Used when a substring contains a newline, so a match may span lines.
 
         Args:
             text: Text to check
@@ -209,7 +363,6 @@ class MultiSubstringMatcher:
         Returns:
             List of (start, end) positions for each substring, or None if no match
         """
-        # Try to match the full pattern
         match_obj = self._regex.search(text)
         if not match_obj:
             return None
@@ -217,33 +370,23 @@ class MultiSubstringMatcher:
         # Now find individual substring positions
         positions = []
         search_start = match_obj.start()
+        for sub_regex in self._sub_regexes:
+            sub_match = sub_regex.search(text, search_start)
+            positions.append(sub_match.span())
+            search_start = sub_match.end()
+        return positions
 
-        for substring in self.substrings:
-            # Build individual regex for this substring
-            if self.fuzzy:
-                sub_pattern = FuzzyRules.to_regex_pattern(substring)
-            else:
-                if self.case_sensitive:
-                    sub_pattern = re.escape(substring)
-                else:
-                    sub_pattern = "".join(
-                        f"[{c.upper()}{c.lower()}]" if c.isalpha() else re.escape(c)
-                        for c in substring
-                    )
-
-            # Search from current position
-            sub_match = re.search(sub_pattern, text[search_start:])
-            if sub_match:
-                actual_start = search_start + sub_match.start()
-                actual_end = search_start + sub_match.end()
-                positions.append((actual_start, actual_end))
-                # Next substring must come after this one
-                search_start = actual_end
-            else:
-                # This shouldn't happen if the full pattern matched
-                return None
+    def match_positions(self, text: str) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find match positions for each substring.
 
-        return positions
+        Args:
+            text: Text to check
+
+        Returns:
+            List of (start, end) positions for each substring, or None if no match
+        """
+        return self._find(text)
 
     def extract_matched_text(self, text: str) -> Optional[str]:
         """
@@ -299,7 +442,7 @@ class MultiSubstringMatcher:
 
     @property
     def regex_pattern(self) -> str:
-        """The compiled regex pattern."""
+        """The combined regex pattern (substrings joined by '.*?')."""
         return self._pattern
 
     def __repr__(self) -> str:
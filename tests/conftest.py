@@ -0,0 +1,60 @@
+"""
+Shared pytest fixtures for the VaniKeys test suite.
+"""
+
+import itertools
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from vanikeys.crypto.derivation import (
+    private_key_to_bytes,
+    public_key_to_bytes,
+    seed_to_root_keypair,
+)
+
+# Prefer tmpfs for seed storage tests: save_seed() fsyncs on every write,
+# which is pure overhead when the temp dir sits on a real disk.
+_TMPFS_DIR = "/dev/shm"
+
+
+def _storage_tmp_root():
+    """Return a tmpfs directory for temp files, or None for the default."""
+    if os.path.isdir(_TMPFS_DIR) and os.access(_TMPFS_DIR, os.W_OK):
+        return _TMPFS_DIR
+    return None
+
+
+@pytest.fixture(scope="session")
+def _storage_session_root():
+    """One temp root per session (tmpfs-backed when available).
+
+    Removed in one go when the session ends.
+    """
+    with tempfile.TemporaryDirectory(
+        prefix="vanikeys-test-", dir=_storage_tmp_root()
+    ) as tmpdir:
+        yield Path(tmpdir), itertools.count()
+
+
+@pytest.fixture
+def temp_storage_dir(_storage_session_root):
+    """Create temporary storage directory."""
+    root, counter = _storage_session_root
+    # Return a per-test subdirectory that doesn't exist yet
+    return root / f"t-{next(counter)}" / "vanikeys"
+
+
+@pytest.fixture(scope="session")
+def known_keypairs():
+    """Root keypair bytes for the fixed test seeds, derived once per session.
+
+    Maps seed -> (public_key_bytes, private_key_bytes).
+    """
+    keypairs = {}
+    for seed in (b"0" * 32, b"1" * 32):
+        priv, pub = seed_to_root_keypair(seed)
+        keypairs[seed] = (public_key_to_bytes(pub), private_key_to_bytes(priv))
+    return keypairs
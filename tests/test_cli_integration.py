@@ -9,9 +9,6 @@ Tests the complete flow:
 Note: These tests do NOT require the API server (they're offline tests).
 """
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from vanikeys.cli.storage import SeedStorage
@@ -23,19 +20,13 @@ from vanikeys.crypto.derivation import (
     private_key_to_bytes,
 )
 from vanikeys.crypto.fingerprint import compute_ssh_fingerprint
-from vanikeys.crypto.matching import matches_pattern
+from vanikeys.crypto.matching import create_pattern_matcher
 from vanikeys.crypto.proofs import generate_order_proof, verify_order_proof
 
 
 class TestCLIIntegration:
     """Integration tests for CLI workflow."""
 
-    @pytest.fixture
-    def temp_storage_dir(self):
-        """Create temporary storage directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-
     @pytest.fixture
     def storage(self, temp_storage_dir):
         """Create storage instance."""
@@ -62,22 +53,22 @@ class TestCLIIntegration:
         # Step 2: Simulate server finding vanity pattern
         # (In production, server would search millions of paths)
         pattern = "a"  # Simple pattern for fast test
+        matcher = create_pattern_matcher(pattern)  # Build once, not per path
         path_index = None
 
         for i in range(1000):  # Search up to 1000 paths
-            child_private, child_public = derive_child_keypair(seed, i)
-            fingerprint = compute_ssh_fingerprint(child_public)
+            _, child_public_key = derive_child_keypair(seed, i)
+            fingerprint = compute_ssh_fingerprint(child_public_key)
 
-            if matches_pattern(pattern, fingerprint):
+            if matcher(fingerprint):
+                # Keep the matching key + fingerprint (no re-derivation needed)
                 path_index = i
                 break
 
         assert path_index is not None, "Should find pattern 'a' in first 1000 paths"
 
         # Step 3: Server generates proof
-        child_private_key, child_public_key = derive_child_keypair(seed, path_index)
         child_public_bytes = public_key_to_bytes(child_public_key)
-        fingerprint = compute_ssh_fingerprint(child_public_key)
 
         proof = generate_order_proof(
             root_public_bytes=root_public_key_bytes,
@@ -173,6 +164,7 @@ class TestCLIIntegration:
 
         # Search for pattern "abc"
         pattern = "abc"
+        matcher = create_pattern_matcher(pattern)
         max_attempts = 10000
         found = False
 
@@ -180,11 +172,11 @@ class TestCLIIntegration:
             _, child_public = derive_child_keypair(seed, i)
             fingerprint = compute_ssh_fingerprint(child_public)
 
-            if matches_pattern(pattern, fingerprint):
+            if matcher(fingerprint):
                 found = True
                 break
 
         # Note: Pattern "abc" has ~1 in 262,144 probability, so we might not find it
         # in 10,000 attempts. This test just validates the search mechanism works.
         if found:
-            assert matches_pattern(pattern, fingerprint)
+            assert matcher(fingerprint)
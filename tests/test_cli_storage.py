@@ -4,8 +4,6 @@ Tests for CLI secure seed storage.
 
 import os
 import json
-import tempfile
-from pathlib import Path
 
 import pytest
 
@@ -16,13 +14,6 @@ from vanikeys.crypto.derivation import generate_master_seed, seed_to_root_keypai
 class TestSeedStorage:
     """Tests for SeedStorage class."""
 
-    @pytest.fixture
-    def temp_storage_dir(self):
-        """Create temporary storage directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Return a subdirectory that doesn't exist yet
-            yield Path(tmpdir) / "vanikeys"
-
     @pytest.fixture
     def storage(self, temp_storage_dir):
         """Create storage instance with temp directory."""
@@ -4,13 +4,24 @@ Tests for SSH Fingerprint Computation
 Tests for SSH wire format encoding and fingerprint computation.
 """
 
+import hashlib
+import struct
+
 import pytest
-from vanikeys.crypto.derivation import generate_master_seed, seed_to_root_keypair
+from vanikeys.crypto.derivation import (
+    derive_child_keypair,
+    derive_children_keypair,
+    generate_master_seed,
+    public_key_to_bytes,
+    seed_to_root_keypair,
+)
 from vanikeys.crypto.fingerprint import (
     ssh_public_key_to_bytes,
     ssh_public_key_to_authorized_keys_format,
     compute_ssh_fingerprint,
+    compute_ssh_fingerprint_batch,
     compute_ssh_fingerprint_md5,
+    compute_ssh_fingerprint_md5_batch,
     extract_fingerprint_searchable,
     compare_fingerprints,
 )
@@ -41,6 +52,19 @@ class TestSSHWireFormat:
 
         assert wire1 == wire2
 
+    def test_ssh_public_key_to_bytes_layout(self):
+        """Wire format is length-prefixed key type followed by length-prefixed key."""
+        seed = b"0" * 32
+        _, pub = seed_to_root_keypair(seed)
+        raw = public_key_to_bytes(pub)
+
+        wire_bytes = ssh_public_key_to_bytes(pub)
+
+        expected = (
+            struct.pack(">I", 11) + b"ssh-ed25519" + struct.pack(">I", 32) + raw
+        )
+        assert wire_bytes == expected
+
 
 class TestAuthorizedKeysFormat:
     """Test OpenSSH authorized_keys format."""
@@ -132,6 +156,19 @@ class TestSHA256Fingerprint:
 
         assert "=" not in fp
 
+    def test_compute_ssh_fingerprint_batch_matches_single(self):
+        """Batch fingerprints equal per-key fingerprints, in order."""
+        parent = b"0" * 32
+        pubs = [derive_child_keypair(parent, i)[1] for i in range(16)]
+
+        fps = compute_ssh_fingerprint_batch(pubs)
+
+        assert fps == [compute_ssh_fingerprint(pub) for pub in pubs]
+
+    def test_compute_ssh_fingerprint_batch_empty(self):
+        """Empty batch produces no fingerprints."""
+        assert compute_ssh_fingerprint_batch([]) == []
+
 
 class TestMD5Fingerprint:
     """Test MD5 fingerprint computation (legacy)."""
@@ -154,9 +191,8 @@ class TestMD5Fingerprint:
 
         fp_md5 = compute_ssh_fingerprint_md5(pub)
 
-        # Remove colons and check remaining chars are hex
-        hex_chars = fp_md5.replace(":", "")
-        assert all(c in "0123456789abcdef" for c in hex_chars)
+        # Deleting hex digits and colons must leave nothing behind
+        assert not fp_md5.encode("ascii").translate(None, b"0123456789abcdef:")
 
     def test_compute_ssh_fingerprint_md5_deterministic(self):
         """Same key produces same MD5 fingerprint."""
@@ -168,6 +204,25 @@ class TestMD5Fingerprint:
 
         assert fp1 == fp2
 
+    def test_compute_ssh_fingerprint_md5_wire_format(self):
+        """MD5 fingerprint is the hex MD5 of the SSH wire format."""
+        seed = b"0" * 32
+        _, pub = seed_to_root_keypair(seed)
+
+        digest = hashlib.md5(ssh_public_key_to_bytes(pub)).digest()
+        expected = ":".join(f"{b:02x}" for b in digest)
+
+        assert compute_ssh_fingerprint_md5(pub) == expected
+
+    def test_compute_ssh_fingerprint_md5_batch(self):
+        """Batch MD5 fingerprints equal per-key fingerprints, in order."""
+        parent = b"0" * 32
+        pubs = [derive_child_keypair(parent, i)[1] for i in range(16)]
+
+        fps = compute_ssh_fingerprint_md5_batch(pubs)
+
+        assert fps == [compute_ssh_fingerprint_md5(pub) for pub in pubs]
+
 
 class TestFingerprintUtilities:
     """Test fingerprint utility functions."""
@@ -222,14 +277,9 @@ class TestRealWorldFingerprints:
     def test_multiple_keys_unique_fingerprints(self):
         """Each key has unique fingerprint."""
         parent = generate_master_seed()
-        fingerprints = set()
-
-        for i in range(100):
-            from vanikeys.crypto.derivation import derive_child_keypair
+        pubs = [pub for _, pub in derive_children_keypair(parent, range(100))]
 
-            _, pub = derive_child_keypair(parent, i)
-            fp = compute_ssh_fingerprint(pub)
-            fingerprints.add(fp)
+        fingerprints = set(compute_ssh_fingerprint_batch(pubs))
 
         # All unique
         assert len(fingerprints) == 100
@@ -37,6 +37,16 @@ class TestPatternMatcher:
         assert not matcher("SHA256:LAB123")
         assert not matcher("SHA256:Lab123")
 
+    def test_prefix_not_searched(self):
+        """The "SHA256:" prefix is not part of the searchable text."""
+        assert not create_pattern_matcher("sha", case_sensitive=False)("SHA256:xyz")
+        assert not create_pattern_matcher("SHA", case_sensitive=True)("SHA256:xyz")
+
+    def test_unprefixed_fingerprint(self):
+        """Bare base64 fingerprints are searched in full."""
+        assert create_pattern_matcher("lab", case_sensitive=False)("LAB123")
+        assert create_pattern_matcher("lab", case_sensitive=True)("lab123")
+
     def test_regex_pattern_matching(self):
         """Regex patterns work."""
         matcher = create_pattern_matcher("lab[0-9]{3}", case_sensitive=False)
@@ -45,6 +55,27 @@ class TestPatternMatcher:
         assert matcher("SHA256:lab999")
         assert not matcher("SHA256:lababc")
 
+    def test_regex_case_insensitive_matching(self):
+        """Case-insensitive regex matches any case."""
+        matcher = create_pattern_matcher("lab[0-9]+", case_sensitive=False)
+
+        assert matcher("SHA256:LAB123")
+        assert matcher("SHA256:Lab123")
+
+    def test_regex_case_sensitive_matching(self):
+        """Case-sensitive regex respects case."""
+        matcher = create_pattern_matcher("Lab[0-9]+", case_sensitive=True)
+
+        assert matcher("SHA256:Lab123")
+        assert not matcher("SHA256:lab123")
+
+    def test_regex_uppercase_escape_preserved(self):
+        """Uppercase escapes keep their meaning when case-insensitive."""
+        matcher = create_pattern_matcher(r"lab\D", case_sensitive=False)
+
+        assert matcher("SHA256:labx")
+        assert not matcher("SHA256:lab1")
+
 
 class TestDifficultyEstimation:
     """Test pattern difficulty estimation."""
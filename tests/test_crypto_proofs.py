@@ -15,8 +15,10 @@ from vanikeys.crypto.fingerprint import compute_ssh_fingerprint
 from vanikeys.crypto.proofs import (
     generate_derivation_proof,
     verify_derivation_proof,
+    verify_derivation_proofs_batch,
     generate_order_proof,
     verify_order_proof,
+    verify_order_proofs_batch,
 )
 
 
@@ -51,6 +53,27 @@ class TestDerivationProof:
 
         assert verify_derivation_proof(proof, seed)
 
+    def test_verify_derivation_proofs_batch_matches_serial(self):
+        """Batch verification agrees with one-at-a-time verification."""
+        seed = b"0" * 32
+        _, root_pub = seed_to_root_keypair(seed)
+        root_bytes = public_key_to_bytes(root_pub)
+
+        proofs = []
+        for i in range(64):
+            _, child_pub = derive_child_keypair(seed, i)
+            proofs.append(generate_derivation_proof(root_bytes, i, child_pub))
+
+        # Tamper with a few
+        proofs[3] = {**proofs[3], "path_index": 999}
+        proofs[17] = {**proofs[17], "derivation_hash": proofs[18]["derivation_hash"]}
+        del proofs[40]["child_public_key"]
+
+        results = verify_derivation_proofs_batch(proofs, seed)
+
+        assert results == [verify_derivation_proof(p, seed) for p in proofs]
+        assert results.count(False) == 3
+
     def test_verify_derivation_proof_wrong_path(self):
         """Tampered path fails verification."""
         seed = generate_master_seed()
@@ -138,6 +161,26 @@ class TestOrderProof:
         assert not result["valid"]
         assert not result["pattern_valid"]
 
+    def test_verify_order_proofs_batch_matches_serial(self):
+        """Batch order verification agrees with one-at-a-time verification."""
+        seed = b"0" * 32
+        _, root_pub = seed_to_root_keypair(seed)
+        root_bytes = public_key_to_bytes(root_pub)
+
+        proofs = []
+        for i in range(16):
+            _, child_pub = derive_child_keypair(seed, i)
+            fp = compute_ssh_fingerprint(child_pub)
+            proofs.append(generate_order_proof(root_bytes, i, child_pub, "a", fp))
+
+        # Tamper with one derivation
+        proofs[5]["derivation"]["path_index"] = 999
+
+        results = verify_order_proofs_batch(proofs, seed, "a")
+
+        assert results == [verify_order_proof(p, seed, "a") for p in proofs]
+        assert not results[5]["derivation_valid"]
+
 
 class TestProofSecurity:
     """Test security properties of proofs."""
@@ -147,13 +190,10 @@ class TestProofSecurity:
         seed = generate_master_seed()
         _, root_pub = seed_to_root_keypair(seed)
         _, child_pub = derive_child_keypair(seed, 42)
+        root_pub_bytes = public_key_to_bytes(root_pub)
 
-        proof1 = generate_derivation_proof(
-            public_key_to_bytes(root_pub), 42, child_pub
-        )
-        proof2 = generate_derivation_proof(
-            public_key_to_bytes(root_pub), 42, child_pub
-        )
+        proof1 = generate_derivation_proof(root_pub_bytes, 42, child_pub)
+        proof2 = generate_derivation_proof(root_pub_bytes, 42, child_pub)
 
         assert proof1 == proof2
 
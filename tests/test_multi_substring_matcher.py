@@ -4,10 +4,20 @@ Tests for multi-substring matcher.
 Tests the core VaniKeys innovation: sequential substring matching.
 """
 
+from functools import lru_cache
+
 import pytest
 from vanikeys.matchers import MultiSubstringMatcher, FuzzyRules
 
 
+@lru_cache(maxsize=128)
+def _matcher(subs: tuple, fuzzy: bool = False, case_sensitive: bool = False):
+    """Build (once) a matcher for the given substrings and options."""
+    return MultiSubstringMatcher(
+        list(subs), fuzzy=fuzzy, case_sensitive=case_sensitive
+    )
+
+
 class TestFuzzyRules:
     """Test fuzzy matching rules."""
 
@@ -24,33 +34,45 @@ class TestFuzzyRules:
         # B/8, 0/O, 0/O, M/m
         assert pattern  # Basic check
 
+    def test_to_regex_pattern_exact_classes(self):
+        """Test generated character classes for fuzzy and plain characters."""
+        assert FuzzyRules.to_regex_pattern("b0m") == "[8Bb][0Oo][Mm]"
+
     def test_normalize(self):
         """Test text normalization."""
         assert FuzzyRules.normalize("B00M") == "BOOM"
         assert FuzzyRules.normalize("G0") == "GO"
         assert FuzzyRules.normalize("1337") == "IEET"  # 1→I, 3→E, 3→E, 7→T
+        assert FuzzyRules.normalize("g4m3:xyz") == "GAME:XYZ"  # Others uppercased
 
 
 class TestMultiSubstringMatcher:
     """Test multi-substring matcher."""
 
-    def test_simple_match(self):
-        """Test simple two-substring match."""
-        matcher = MultiSubstringMatcher(["GO", "BE"])
-        assert matcher.match("GOxxxBE")
-        assert matcher.match("did:key:z6MkGOxxxBExxx")
-        assert not matcher.match("BExxxGO")  # Wrong order
-
-    def test_multi_substring_match(self):
-        """Test multi-substring (VaniKeys innovation!)."""
-        matcher = MultiSubstringMatcher(["GO", "BE", "AWE", "SOME"])
-        assert matcher.match("GOxxxBExxxAWExxxSOME")
-        assert matcher.match("did:key:z6MkGOxBExAWExSOME")
-        assert not matcher.match("GOxxxAWExxxBExxxSOME")  # Wrong order
+    @pytest.mark.parametrize(
+        "subs,text,expected",
+        [
+            # Simple two-substring match
+            (("GO", "BE"), "GOxxxBE", True),
+            (("GO", "BE"), "did:key:z6MkGOxxxBExxx", True),
+            (("GO", "BE"), "BExxxGO", False),  # Wrong order
+            # Multi-substring (VaniKeys innovation!)
+            (("GO", "BE", "AWE", "SOME"), "GOxxxBExxxAWExxxSOME", True),
+            (("GO", "BE", "AWE", "SOME"), "did:key:z6MkGOxBExAWExSOME", True),
+            (("GO", "BE", "AWE", "SOME"), "GOxxxAWExxxBExxxSOME", False),
+        ],
+        ids=[
+            "simple", "simple_did", "simple_order",
+            "multi", "multi_did", "multi_order",
+        ],
+    )
+    def test_match(self, subs, text, expected):
+        """Test ordered substring matching."""
+        assert _matcher(subs).match(text) is expected
 
     def test_fuzzy_matching(self):
         """Test fuzzy matching (leetspeak)."""
-        matcher = MultiSubstringMatcher(["B00M"], fuzzy=True)
+        matcher = _matcher(("B00M",), fuzzy=True)
         assert matcher.match("BOOM")  # 0→O
         assert matcher.match("B00M")  # Exact
         assert matcher.match("B0OM")  # Mix
@@ -58,51 +80,135 @@ class TestMultiSubstringMatcher:
 
     def test_case_insensitive(self):
         """Test case-insensitive matching."""
-        matcher = MultiSubstringMatcher(["ALICE"], case_sensitive=False)
+        matcher = _matcher(("ALICE",), case_sensitive=False)
         assert matcher.match("alice")
         assert matcher.match("Alice")
         assert matcher.match("ALICE")
 
+    def test_case_insensitive_rejects_missing_first_substring(self):
+        """Test case-insensitive matching with and without the first substring."""
+        matcher = _matcher(("GO", "BE"))
+        assert matcher.match("xgOxbE")
+        assert not matcher.match("xxxbExxx")  # First substring absent
+        assert not matcher.match("xbExgo")  # Present, but out of order
+
+    @pytest.mark.parametrize(
+        "fuzzy,case_sensitive,text",
+        [(True, False, "GO\nBE"), (False, False, "gO\nxBe")],
+        ids=["fuzzy", "nocase"],
+    )
+    def test_substrings_do_not_span_lines(self, fuzzy, case_sensitive, text):
+        """Test gaps between substrings stop at newlines, as '.*?' does."""
+        matcher = _matcher(("GO", "BE"), fuzzy=fuzzy, case_sensitive=case_sensitive)
+        assert not matcher.match(text)
+        assert matcher.match_positions(text) is None
+        assert matcher.match_positions(text + "\ngobe") == [
+            (len(text) + 1, len(text) + 3),
+            (len(text) + 3, len(text) + 5),
+        ]
+
+    def test_substring_containing_newline(self):
+        """Test a substring may itself contain a newline."""
+        matcher = _matcher(("O\nB", "E"))
+        assert matcher.match("GO\nBxE")
+        assert matcher.match_positions("xO\nBxe") == [(1, 4), (5, 6)]
+        assert not matcher.match("GO\nB\nE")
+
     def test_case_sensitive(self):
         """Test case-sensitive matching."""
-        matcher = MultiSubstringMatcher(["ALICE"], case_sensitive=True)
+        matcher = _matcher(("ALICE",), case_sensitive=True)
         assert matcher.match("ALICE")
         assert not matcher.match("alice")
 
+    def test_case_sensitive_multi_order(self):
+        """Test exact case-sensitive matching enforces order and case."""
+        matcher = _matcher(("GO", "BE", "AWE"), case_sensitive=True)
+        assert matcher.match("did:key:z6MkGOxBExAWE")
+        assert matcher.match("GOBEAWE")  # Adjacent substrings
+        assert not matcher.match("GOxAWExBE")  # Wrong order
+        assert not matcher.match("GOxbexAWE")  # Wrong case
+        assert not matcher.match("GOBExAWGOBE")  # Repeats, but no AWE after BE
+
+    def test_case_sensitive_substrings_do_not_span_lines(self):
+        """Test exact matching keeps the regex rule that gaps stop at newlines."""
+        matcher = _matcher(("GO", "BE"), case_sensitive=True)
+        assert not matcher.match("GO\nBE")
+        assert matcher.match_positions("GO\nxGOxBE") == [(4, 6), (7, 9)]
+        assert matcher.match_positions("GOBE\nGOBE") == [(0, 2), (2, 4)]
+
+    @pytest.mark.parametrize(
+        "fuzzy,case_sensitive",
+        [(False, True), (False, False), (True, False)],
+        ids=["exact", "nocase", "fuzzy"],
+    )
+    def test_match_many(self, fuzzy, case_sensitive):
+        """Test bulk matching agrees with match() in every mode."""
+        matcher = _matcher(("GO", "BE"), fuzzy=fuzzy, case_sensitive=case_sensitive)
+        texts = ["GOxBE", "goxbe", "G0x8E", "BExGO", "xxx", ""]
+        assert matcher.match_many(texts) == [matcher.match(t) for t in texts]
+        assert matcher.match_many([]) == []
+
+    def test_match_many_uses_substrings_from_construction(self):
+        """Test later edits to the caller's list change neither match API."""
+        substrings = ["GO", "BE"]
+        matcher = MultiSubstringMatcher(substrings, case_sensitive=True)
+        substrings[0] = "XX"
+
+        texts = ["GOxBE", "XXxBE"]
+        assert matcher.match_many(texts) == [matcher.match(t) for t in texts]
+        assert matcher.match_many(texts) == [True, False]
+
     def test_match_positions(self):
         """Test finding match positions."""
-        matcher = MultiSubstringMatcher(["GO", "BE"])
+        matcher = _matcher(("GO", "BE"))
         positions = matcher.match_positions("xxGOxxxBExx")
         assert positions == [(2, 4), (7, 9)]
 
     def test_match_positions_multi(self):
         """Test finding positions for multi-substring."""
-        matcher = MultiSubstringMatcher(["GO", "BE", "AWE"])
+        matcher = _matcher(("GO", "BE", "AWE"))
         text = "did:key:z6MkGOxBExAWE"
         positions = matcher.match_positions(text)
         assert positions is not None
         assert len(positions) == 3
 
+    def test_match_positions_case_sensitive(self):
+        """Test positions for exact case-sensitive substrings."""
+        matcher = _matcher(("GO", "BE"), case_sensitive=True)
+        assert matcher.match_positions("goxGOxbeBEGO") == [(3, 5), (8, 10)]
+        assert matcher.match_positions("BExGO") is None
+
+    def test_match_positions_fuzzy(self):
+        """Test positions are absolute offsets for fuzzy substrings."""
+        matcher = _matcher(("B00M", "GO"), fuzzy=True)
+        positions = matcher.match_positions("xxgoxB0OMxxg0x")
+        assert positions == [(5, 9), (11, 13)]
+
+    def test_fuzzy_order_with_repeated_partial_matches(self):
+        """Test fuzzy ordering when earlier substrings repeat many times."""
+        matcher = _matcher(("GO", "BE", "AWE"), fuzzy=True)
+        text = "g0" * 20 + "8e" * 20 + "xx"
+        assert not matcher.match(text)
+        assert matcher.match_positions(text + "4W3") == [(0, 2), (40, 42), (82, 85)]
+
     def test_extract_matched_text(self):
         """Test extracting matched portion."""
-        matcher = MultiSubstringMatcher(["GO", "BE"])
+        matcher = _matcher(("GO", "BE"))
         matched = matcher.extract_matched_text("xxGOxxxBExx")
         assert matched == "GOxxxBE"
 
     def test_no_match(self):
         """Test when pattern doesn't match."""
-        matcher = MultiSubstringMatcher(["GO", "BE"])
+        matcher = _matcher(("GO", "BE"))
         assert not matcher.match("ALICE")
         assert matcher.match_positions("ALICE") is None
         assert matcher.extract_matched_text("ALICE") is None
 
     def test_explain_match(self):
         """Test match explanation."""
-        matcher = MultiSubstringMatcher(["GO", "BE"])
+        matcher = _matcher(("GO", "BE"))
         explanation = matcher.explain_match("xxGOxxxBExx")
-        assert "GO" in explanation
-        assert "BE" in explanation
-        assert "position" in explanation
+        assert all(n in explanation for n in ("GO", "BE", "position"))
 
     def test_empty_substrings_raises(self):
         """Test that empty substrings raises error."""
@@ -111,17 +217,17 @@ class TestMultiSubstringMatcher:
 
     def test_pattern_string(self):
         """Test human-readable pattern string."""
-        matcher = MultiSubstringMatcher(["GO", "BE", "AWE"])
+        matcher = _matcher(("GO", "BE", "AWE"))
         assert matcher.pattern_string == "GO BE AWE"
 
     def test_regex_pattern_property(self):
         """Test regex pattern property."""
-        matcher = MultiSubstringMatcher(["GO", "BE"])
+        matcher = _matcher(("GO", "BE"))
         assert matcher.regex_pattern  # Should be non-empty
 
     def test_repr(self):
         """Test string representation."""
-        matcher = MultiSubstringMatcher(["GO", "BE"], fuzzy=True)
+        matcher = _matcher(("GO", "BE"), fuzzy=True)
         repr_str = repr(matcher)
         assert "MultiSubstringMatcher" in repr_str
         assert "fuzzy" in repr_str
@@ -130,27 +236,25 @@ class TestMultiSubstringMatcher:
 class TestRealWorldPatterns:
     """Test with real-world DID key patterns."""
 
-    def test_did_key_prefix_match(self):
+    @pytest.mark.parametrize(
+        "subs,text,expected",
+        [
+            (("ALICE",), "did:key:z6MkALICExyz123", True),
+            (("ALICE",), "did:key:z6MkBOBxyz123", False),
+            (("GO", "BE", "GREAT"), "did:key:z6MkGOxBExGREATxyz", True),
+            (("GO", "BE", "GREAT"), "did:key:z6MkGOxGREATxBExyz", False),  # Order
+            # The canonical VaniKeys example: 'GO BE AWE SOME'
+            (("GO", "BE", "AWE", "SOME"), "did:key:z6MkGOaaBExxxAWEyySOMEzzz", True),
+            (("GO", "BE", "AWE", "SOME"), "did:key:z6MkGOaaSOMExxxAWEyyBEzzz", False),
+        ],
+        ids=["alice", "bob", "multi", "multi_order", "vanikeys", "vanikeys_order"],
+    )
+    def test_did_key_match(self, subs, text, expected):
         """Test matching in real DID keys."""
-        matcher = MultiSubstringMatcher(["ALICE"])
-        assert matcher.match("did:key:z6MkALICExyz123")
-        assert not matcher.match("did:key:z6MkBOBxyz123")
-
-    def test_did_key_multi_substring(self):
-        """Test multi-substring in real DID keys."""
-        matcher = MultiSubstringMatcher(["GO", "BE", "GREAT"])
-        assert matcher.match("did:key:z6MkGOxBExGREATxyz")
-        assert not matcher.match("did:key:z6MkGOxGREATxBExyz")  # Wrong order
+        assert _matcher(subs).match(text) is expected
 
     def test_did_key_fuzzy_match(self):
         """Test fuzzy matching in real DID keys."""
-        matcher = MultiSubstringMatcher(["C00L"], fuzzy=True)
+        matcher = _matcher(("C00L",), fuzzy=True)
         assert matcher.match("did:key:z6MkCOOLxyz")  # 0→O
         assert matcher.match("did:key:z6MkC00Lxyz")  # Exact
-
-    def test_vanikeys_example(self):
-        """Test the canonical VaniKeys example: 'GO BE AWE SOME'."""
-        matcher = MultiSubstringMatcher(["GO", "BE", "AWE", "SOME"])
-        # This is what VaniKeys generates!
-        assert matcher.match("did:key:z6MkGOaaBExxxAWEyySOMEzzz")
-        assert not matcher.match("did:key:z6MkGOaaSOMExxxAWEyyBEzzz")  # Wrong order
@@ -9,17 +9,19 @@ from vanikeys.core import ProbabilityCalculator
 from vanikeys.domain import Pattern, MatchMode, FuzzyMode
 
 
+@pytest.fixture(scope="module")
+def calc():
+    """One calculator shared by the module, so its result cache stays warm."""
+    return ProbabilityCalculator()
+
+
 class TestProbabilityCalculator:
     """Test probability calculator."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.calc = ProbabilityCalculator()
-
-    def test_simple_prefix_pattern(self):
+    def test_simple_prefix_pattern(self, calc):
         """Test simple prefix pattern probability."""
         pattern = Pattern(substrings=["GO"], mode=MatchMode.PREFIX)
-        result = self.calc.calculate(pattern)
+        result = calc.calculate(pattern)
 
         # Should have reasonable probability
         assert result["probability"] > 0
@@ -32,19 +34,19 @@ class TestProbabilityCalculator:
         assert result["cost_tokens"] >= 50
         assert result["cost_guaranteed_usd"] >= 5.0
 
-    def test_longer_prefix_harder(self):
+    def test_longer_prefix_harder(self, calc):
         """Test that longer patterns are harder."""
         short_pattern = Pattern(substrings=["GO"], mode=MatchMode.PREFIX)
         long_pattern = Pattern(substrings=["ALICE"], mode=MatchMode.PREFIX)
 
-        short_result = self.calc.calculate(short_pattern)
-        long_result = self.calc.calculate(long_pattern)
+        short_result = calc.calculate(short_pattern)
+        long_result = calc.calculate(long_pattern)
 
         # Longer pattern should be harder
         assert long_result["expected_attempts"] > short_result["expected_attempts"]
         assert long_result["cost_tokens"] > short_result["cost_tokens"]
 
-    def test_multi_substring_harder(self):
+    def test_multi_substring_harder(self, calc):
         """Test that multi-substring is harder than single."""
         single = Pattern(substrings=["GO"], mode=MatchMode.PREFIX)
         multi = Pattern(
@@ -52,14 +54,14 @@ class TestProbabilityCalculator:
             mode=MatchMode.MULTI_SUBSTRING,
         )
 
-        single_result = self.calc.calculate(single)
-        multi_result = self.calc.calculate(multi)
+        single_result = calc.calculate(single)
+        multi_result = calc.calculate(multi)
 
         # Multi-substring should be harder
         assert multi_result["expected_attempts"] > single_result["expected_attempts"]
         assert multi_result["cost_tokens"] > single_result["cost_tokens"]
 
-    def test_fuzzy_matching_easier(self):
+    def test_fuzzy_matching_easier(self, calc):
         """Test that fuzzy matching is easier."""
         exact = Pattern(
             substrings=["B00M"],
@@ -72,112 +74,179 @@ class TestProbabilityCalculator:
             fuzzy=FuzzyMode.LEETSPEAK,
         )
 
-        exact_result = self.calc.calculate(exact)
-        fuzzy_result = self.calc.calculate(fuzzy)
+        exact_result = calc.calculate(exact)
+        fuzzy_result = calc.calculate(fuzzy)
 
         # Fuzzy should be easier (more valid chars per position)
         assert fuzzy_result["expected_attempts"] < exact_result["expected_attempts"]
 
-    def test_difficulty_score(self):
+    def test_difficulty_score(self, calc):
         """Test difficulty score calculation."""
         pattern = Pattern(substrings=["ALICE"], mode=MatchMode.PREFIX)
-        result = self.calc.calculate(pattern)
+        result = calc.calculate(pattern)
 
         # Difficulty score is log10 of expected attempts
         assert result["difficulty_score"] >= 0
 
-    def test_odds_display_formatting(self):
+    def test_odds_display_formatting(self, calc):
         """Test human-readable odds formatting."""
         # Test various scales
-        assert "1 in 1.0K" in self.calc._format_odds(1000)
-        assert "1 in 1.0M" in self.calc._format_odds(1_000_000)
-        assert "1 in 4.2B" in self.calc._format_odds(4_200_000_000)
-
-    def test_token_cost_scaling(self):
+        assert "1 in 1.0K" in calc._format_odds(1000)
+        assert "1 in 1.0M" in calc._format_odds(1_000_000)
+        assert "1 in 4.2B" in calc._format_odds(4_200_000_000)
+
+    def test_odds_display_boundaries(self, calc):
+        """Test odds formatting at and around each scale boundary."""
+        assert calc._format_odds(0.5) == "~100% chance"
+        assert calc._format_odds(1.5) == "1 in 1.5"
+        assert calc._format_odds(999) == "1 in 999.0"
+        assert calc._format_odds(1000) == "1 in 1.0K"
+        assert calc._format_odds(999_999) == "1 in 1000.0K"
+        assert calc._format_odds(1e12) == "1 in 1.0T"
+        assert calc._format_odds(3.5e15) == "1 in 3500.0T"
+        assert calc._format_odds(float("inf")) == "1 in ∞ (impossible)"
+
+    @pytest.mark.parametrize(
+        "easier,harder",
+        [("A", "ABC"), ("ABC", "ALICE")],
+        ids=["easy_medium", "medium_hard"],
+    )
+    def test_token_cost_scaling(self, calc, easier, harder):
         """Test token cost scales with difficulty."""
-        easy = Pattern(substrings=["A"], mode=MatchMode.PREFIX)
-        medium = Pattern(substrings=["ABC"], mode=MatchMode.PREFIX)
-        hard = Pattern(substrings=["ALICE"], mode=MatchMode.PREFIX)
-
-        easy_cost = self.calc.calculate(easy)["cost_tokens"]
-        medium_cost = self.calc.calculate(medium)["cost_tokens"]
-        hard_cost = self.calc.calculate(hard)["cost_tokens"]
+        easier_cost = calc.calculate(
+            Pattern(substrings=[easier], mode=MatchMode.PREFIX)
+        )["cost_tokens"]
+        harder_cost = calc.calculate(
+            Pattern(substrings=[harder], mode=MatchMode.PREFIX)
+        )["cost_tokens"]
 
         # Costs should increase with difficulty
-        assert easy_cost <= medium_cost <= hard_cost
-
-    def test_guaranteed_cost_minimum(self):
+        assert easier_cost <= harder_cost
+
+    def test_calculate_many(self, calc):
+        """Test batch calculation matches per-pattern results in order."""
+        patterns = [
+            Pattern(substrings=["A"], mode=MatchMode.PREFIX),
+            Pattern(substrings=["GO", "BE"], mode=MatchMode.MULTI_SUBSTRING),
+            Pattern(substrings=["A"], mode=MatchMode.PREFIX),
+        ]
+        results = calc.calculate_many(patterns)
+
+        fresh = ProbabilityCalculator()
+        assert results == [fresh.calculate(pattern) for pattern in patterns]
+        assert results[0] is not results[2]
+        assert calc.calculate_many([]) == []
+
+    @pytest.mark.parametrize("threshold", [0.0, 2.0, 5.0, 8.0, 20.0, 100.0])
+    @pytest.mark.parametrize(
+        "substrings,mode",
+        [
+            (["ALICE"], MatchMode.PREFIX),
+            (["ALICE"], MatchMode.CONTAINS),
+            (["GO", "BE"], MatchMode.MULTI_SUBSTRING),
+            (["GO", "BE", "AWE", "SOME", "COOL"], MatchMode.MULTI_SUBSTRING),
+        ],
+        ids=["prefix", "contains", "multi", "whale"],
+    )
+    def test_meets_difficulty_agrees_with_calculate(
+        self, calc, substrings, mode, threshold
+    ):
+        """Test meets_difficulty matches the full calculation's score."""
+        pattern = Pattern(substrings=substrings, mode=mode)
+        score = calc.calculate(pattern)["difficulty_score"]
+        assert calc.meets_difficulty(pattern, threshold) is (score >= threshold)
+
+    def test_guaranteed_cost_minimum(self, calc):
         """Test guaranteed mode has minimum cost."""
         pattern = Pattern(substrings=["A"], mode=MatchMode.PREFIX)
-        result = self.calc.calculate(pattern)
+        result = calc.calculate(pattern)
 
         # Minimum guaranteed cost is $5.00
         assert result["cost_guaranteed_usd"] >= 5.0
 
-    def test_guaranteed_cost_scales(self):
+    def test_guaranteed_cost_scales(self, calc):
         """Test guaranteed cost scales with difficulty."""
         easy = Pattern(substrings=["GO"], mode=MatchMode.PREFIX)
         hard = Pattern(substrings=["GOBEAWESOME"], mode=MatchMode.PREFIX)
 
-        easy_cost = self.calc.calculate(easy)["cost_guaranteed_usd"]
-        hard_cost = self.calc.calculate(hard)["cost_guaranteed_usd"]
+        easy_cost = calc.calculate(easy)["cost_guaranteed_usd"]
+        hard_cost = calc.calculate(hard)["cost_guaranteed_usd"]
 
         # Harder pattern should cost more
         assert hard_cost > easy_cost
 
-    def test_explain_calculation(self):
+    def test_explain_calculation(self, calc):
         """Test calculation explanation."""
         pattern = Pattern(
             substrings=["GO", "BE"],
             mode=MatchMode.MULTI_SUBSTRING,
         )
-        explanation = self.calc.explain_calculation(pattern)
+        explanation = calc.explain_calculation(pattern)
 
         # Should contain key information
         assert "GO BE" in explanation
-        assert "Multi-substring" in explanation.lower() or "multi" in explanation.lower()
-        assert "probability" in explanation.lower() or "odds" in explanation.lower()
-        assert "cost" in explanation.lower() or "tokens" in explanation.lower()
+        lowered = explanation.lower()
+        assert "multi" in lowered
+        assert any(n in lowered for n in ("probability", "odds"))
+        assert any(n in lowered for n in ("cost", "tokens"))
 
-    def test_contains_mode(self):
+    def test_contains_mode(self, calc):
         """Test 'contains' mode probability."""
         pattern = Pattern(substrings=["ALICE"], mode=MatchMode.CONTAINS)
-        result = self.calc.calculate(pattern)
+        result = calc.calculate(pattern)
 
         # Should be easier than prefix (more positions to match)
         prefix_pattern = Pattern(substrings=["ALICE"], mode=MatchMode.PREFIX)
-        prefix_result = self.calc.calculate(prefix_pattern)
+        prefix_result = calc.calculate(prefix_pattern)
 
         # Contains should have higher probability
         assert result["probability"] >= prefix_result["probability"]
 
-    def test_suffix_mode(self):
+    def test_suffix_mode(self, calc):
         """Test suffix mode probability."""
         pattern = Pattern(substrings=["ALICE"], mode=MatchMode.SUFFIX)
-        result = self.calc.calculate(pattern)
+        result = calc.calculate(pattern)
 
         # Should be same as prefix (just position-specific)
         prefix_pattern = Pattern(substrings=["ALICE"], mode=MatchMode.PREFIX)
-        prefix_result = self.calc.calculate(prefix_pattern)
+        prefix_result = calc.calculate(prefix_pattern)
 
         # Probabilities should be similar
         assert abs(result["probability"] - prefix_result["probability"]) < 0.0001
 
+    def test_repeated_calculate_is_cached(self, calc):
+        """Test repeated patterns reuse results without sharing the dict."""
+        first = calc.calculate(Pattern(substrings=["GO"], mode=MatchMode.PREFIX))
+        first["cost_tokens"] = -1  # Callers mutating their copy is harmless
+
+        again = calc.calculate(Pattern(substrings=["GO"], mode=MatchMode.PREFIX))
+        assert again is not first
+        assert again == ProbabilityCalculator().calculate(
+            Pattern(substrings=["GO"], mode=MatchMode.PREFIX)
+        )
+
+    def test_cache_distinguishes_fuzzy_mode(self, calc):
+        """Test patterns differing only in fuzzy mode get separate results."""
+        exact = Pattern(substrings=["B00M"], mode=MatchMode.PREFIX)
+        fuzzy = Pattern(
+            substrings=["B00M"], mode=MatchMode.PREFIX, fuzzy=FuzzyMode.LEETSPEAK
+        )
+        assert (
+            calc.calculate(exact)["probability"]
+            < calc.calculate(fuzzy)["probability"]
+        )
+
 
 class TestRealWorldPatterns:
     """Test with real-world pattern examples."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.calc = ProbabilityCalculator()
-
-    def test_canonical_vanikeys_example(self):
+    def test_canonical_vanikeys_example(self, calc):
         """Test the canonical VaniKeys example: 'GO BE AWE SOME'."""
         pattern = Pattern(
             substrings=["GO", "BE", "AWE", "SOME"],
             mode=MatchMode.MULTI_SUBSTRING,
         )
-        result = self.calc.calculate(pattern)
+        result = calc.calculate(pattern)
 
         # This should be quite difficult
         assert result["difficulty_score"] > 5.0  # At least 100K attempts
@@ -186,43 +255,43 @@ class TestRealWorldPatterns:
         # Should have human-readable odds
         assert "1 in" in result["odds_display"]
 
-    def test_simple_business_did(self):
+    def test_simple_business_did(self, calc):
         """Test simple business DID (e.g., 'ACME')."""
         pattern = Pattern(substrings=["ACME"], mode=MatchMode.PREFIX)
-        result = self.calc.calculate(pattern)
+        result = calc.calculate(pattern)
 
         # Should be moderately difficult
         assert result["cost_tokens"] >= 50
         assert result["cost_guaranteed_usd"] >= 5.0
 
-    def test_personal_name(self):
+    def test_personal_name(self, calc):
         """Test personal name (e.g., 'ALICE')."""
         pattern = Pattern(substrings=["ALICE"], mode=MatchMode.PREFIX)
-        result = self.calc.calculate(pattern)
+        result = calc.calculate(pattern)
 
         # Should be difficult (5 characters)
         assert result["difficulty_score"] > 4.0
         assert result["cost_tokens"] >= 80
 
-    def test_fuzzy_cool_pattern(self):
+    def test_fuzzy_cool_pattern(self, calc):
         """Test fuzzy 'C00L' pattern."""
         pattern = Pattern(
             substrings=["C00L"],
             mode=MatchMode.PREFIX,
             fuzzy=FuzzyMode.LEETSPEAK,
         )
-        result = self.calc.calculate(pattern)
+        result = calc.calculate(pattern)
 
         # Should be easier than exact "C00L"
         assert result["cost_tokens"] >= 50
 
-    def test_whale_pattern(self):
+    def test_whale_pattern(self, calc):
         """Test very difficult whale pattern."""
         pattern = Pattern(
             substrings=["GO", "BE", "AWE", "SOME", "COOL"],
             mode=MatchMode.MULTI_SUBSTRING,
         )
-        result = self.calc.calculate(pattern)
+        result = calc.calculate(pattern)
 
         # This should be extremely difficult
         assert result["difficulty_score"] > 8.0